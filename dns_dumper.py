@@ -4,102 +4,704 @@ DNS Record Dumper - Extract comprehensive DNS information for domain transfers
 """
 
 import argparse
+import asyncio
+import ctypes
 import json
 import csv
+import ipaddress
+import os
+import secrets
+import socket
+import sqlite3
+import struct
 import sys
-import subprocess
-from typing import Dict, List, Optional
+import time
+import zlib
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
-class DNSDumper:
-    def __init__(self):
-        self.common_record_types = [
-            'A', 'AAAA', 'CNAME', 'MX', 'NS', 'TXT', 'SOA', 
-            'PTR', 'SRV', 'CAA', 'DNSKEY', 'DS'
-        ]
-        # Standard web and service subdomains
-        self.standard_subdomains = [
-            'www', 'mail', 'ftp', 'smtp', 'pop', 'imap', 'webmail',
-            'admin', 'blog', 'shop', 'store', 'api', 'cdn', 'static',
-            'img', 'images', 'assets', 'files', 'download', 'uploads',
-            'dev', 'test', 'staging', 'beta', 'demo', 'support',
-            'help', 'docs', 'wiki', 'forum', 'news', 'mobile',
-            'app', 'secure', 'vpn', 'remote', 'portal', 'login',
-            'cpanel', 'whm', 'ns1', 'ns2', 'mx1', 'mx2'
+import dns.asyncbackend
+import dns.asyncresolver
+import dns.entropy
+import dns.exception
+import dns.flags
+import dns.message
+import dns.name
+import dns.nameserver
+import dns.opcode
+import dns.rcode
+import dns.rdataclass
+import dns.rdatatype
+import dns.resolver
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class RecordSet:
+    """Values found for one name and record type, plus dig-style detail for some types"""
+    __slots__ = ('values', 'detailed')
+    
+    def __init__(self, values: List[str], detailed: Optional[str] = None):
+        self.values = values
+        self.detailed = detailed
+    
+    @property
+    def count(self) -> int:
+        return len(self.values)
+    
+    def __eq__(self, other):
+        if not isinstance(other, RecordSet):
+            return NotImplemented
+        return self.values == other.values and self.detailed == other.detailed
+    
+    def __repr__(self):
+        return f"RecordSet(values={self.values!r}, detailed={self.detailed!r})"
+    
+    def to_dict(self) -> Dict:
+        """Return the JSON form: values, count and detailed if present"""
+        data = {'values': self.values, 'count': len(self.values)}
+        if self.detailed is not None:
+            data['detailed'] = self.detailed
+        return data
+
+class TTLCache:
+    """Process-local LRU cache whose entries expire after the record TTL"""
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key, value, ttl: float):
+        """Store value for ttl seconds, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def items(self) -> Iterator[Tuple[object, float, object]]:
+        """Yield (key, remaining_ttl, value) for every entry that has not expired"""
+        now = time.monotonic()
+        for key, (expiry, value) in self._entries.items():
+            if expiry > now:
+                yield key, expiry - now, value
+
+class DiskCache:
+    """SQLite file that carries cached answers over between runs
+    
+    Answers are stored as the response in wire format with an absolute
+    expiry time; NXDOMAIN / no-answer results are stored without a response.
+    Rows are kept per set of configured nameservers (resolvers), so a run
+    against other nameservers never sees them. Raises sqlite3.Error if the
+    file cannot be opened as a cache.
+    """
+    # Bumped whenever the table layout changes; older tables are dropped
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, filename: str, resolvers: str):
+        self.filename = filename
+        self.resolvers = resolvers
+        self._db = sqlite3.connect(filename)
+        try:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            with self._db:
+                if self._db.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+                    self._db.execute('DROP TABLE IF EXISTS answers')
+                    self._db.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+                self._db.execute(
+                    'CREATE TABLE IF NOT EXISTS answers ('
+                    'resolvers TEXT NOT NULL, name TEXT NOT NULL, record_type TEXT NOT NULL, '
+                    'expiry REAL NOT NULL, kind TEXT NOT NULL, response BLOB, nameserver TEXT, '
+                    'port INTEGER, PRIMARY KEY (resolvers, name, record_type))'
+                )
+        except sqlite3.Error:
+            self._db.close()
+            raise
+    
+    def load(self, cache: TTLCache) -> int:
+        """Copy every unexpired stored answer into cache, returning how many were loaded"""
+        now = time.time()
+        with self._db:
+            self._db.execute('DELETE FROM answers WHERE expiry <= ?', (now,))
+        rows = self._db.execute(
+            'SELECT name, record_type, expiry, kind, response, nameserver, port FROM answers '
+            'WHERE resolvers = ?', (self.resolvers,)
+        ).fetchall()
+        for name, record_type, expiry, kind, response, nameserver, port in rows:
+            qname = dns.name.from_text(name)
+            if kind == 'nxdomain':
+                value = dns.resolver.NXDOMAIN(qnames=[qname])
+            elif kind == 'noanswer':
+                value = dns.resolver.NoAnswer()
+            else:
+                value = dns.resolver.Answer(qname, dns.rdatatype.from_text(record_type),
+                                            dns.rdataclass.IN, dns.message.from_wire(response),
+                                            nameserver, port)
+            cache.set((name, record_type), value, expiry - now)
+        return len(rows)
+    
+    def save(self, cache: TTLCache):
+        """Store every unexpired entry of cache, replacing older copies"""
+        now = time.time()
+        rows = []
+        for (name, record_type), ttl, value in cache.items():
+            if isinstance(value, dns.resolver.NXDOMAIN):
+                rows.append((self.resolvers, name, record_type, now + ttl, 'nxdomain', None, None, None))
+            elif isinstance(value, dns.resolver.NoAnswer):
+                rows.append((self.resolvers, name, record_type, now + ttl, 'noanswer', None, None, None))
+            else:
+                rows.append((self.resolvers, name, record_type, now + ttl, 'answer', value.response.to_wire(),
+                             value.nameserver, value.port))
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+# Output files are written through a large buffer to keep write syscalls rare
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+class CSVRecordWriter:
+    """Write records to a CSV file as they are found"""
+    def __init__(self, filename: str):
+        self.filename = filename
+    
+    def begin(self, domain: str, timestamp: str):
+        self.domain = domain
+        self.timestamp = timestamp
+        self._file = open(self.filename, 'w', newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(['Domain', 'Subdomain', 'Record Type', 'Value', 'Timestamp'])
+    
+    def write(self, scope: str, name: str, record_type: str, entry: RecordSet):
+        subdomain = name if scope == 'subdomains' else ''
+        self._writer.writerows((self.domain, subdomain, record_type, value, self.timestamp)
+                               for value in entry.values)
+    
+    def end(self):
+        self._file.close()
+        print(f"CSV output saved to: {self.filename}")
+
+class JSONRecordWriter:
+    """Write records to a JSON file as they are found
+    
+    Produces the same document as json.dump(data, indent=2), but emits each
+    record set as it arrives instead of serializing the whole dict at once.
+    Expects main domain records first and each subdomain's records together.
+    """
+    def __init__(self, filename: str):
+        self.filename = filename
+    
+    def _dumps(self, value, level: int = 0) -> str:
+        # orjson is much faster and renders the same text as the stdlib
+        # with indent=2 / ensure_ascii=False; it is optional
+        if orjson is not None:
+            text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            text = json.dumps(value, indent=2, ensure_ascii=False)
+        return text.replace('\n', '\n' + ' ' * level)
+    
+    def _key(self, key: str, level: int, first: bool):
+        self._file.write(f"{'' if first else ','}\n{' ' * level}{self._dumps(key)}: ")
+    
+    def begin(self, domain: str, timestamp: str):
+        self._file = open(self.filename, 'w', encoding='utf-8')
+        self._file.write(f'{{\n  "domain": {self._dumps(domain)},\n  "timestamp": {self._dumps(timestamp)},\n  "records": {{')
+        self._scope = 'records'
+        self._name = None
+        self._empty = True
+    
+    def _close_object(self, level: int, empty: bool):
+        self._file.write('}' if empty else f"\n{' ' * level}}}")
+    
+    def _enter_subdomains(self):
+        self._close_object(2, self._empty)
+        self._file.write(',\n  "subdomains": {')
+        self._scope = 'subdomains'
+        self._empty = True
+    
+    def write(self, scope: str, name: str, record_type: str, entry: RecordSet):
+        if scope == 'records':
+            self._key(record_type, 4, self._empty)
+            self._file.write(self._dumps(entry.to_dict(), 4))
+            self._empty = False
+            return
+        if self._scope == 'records':
+            self._enter_subdomains()
+        if name != self._name:
+            if self._name is not None:
+                self._close_object(4, False)
+            self._key(name, 4, self._empty)
+            self._file.write('{')
+            self._name = name
+            self._empty = False
+            self._name_empty = True
+        self._key(record_type, 6, self._name_empty)
+        self._file.write(self._dumps(entry.to_dict(), 6))
+        self._name_empty = False
+    
+    def end(self):
+        if self._scope == 'records':
+            self._enter_subdomains()
+        if self._name is not None:
+            self._close_object(4, False)
+        self._close_object(2, self._empty)
+        self._file.write('\n}')
+        self._file.close()
+        print(f"JSON output saved to: {self.filename}")
+
+class JSONLRecordWriter:
+    """Write one JSON object per record set to a file as they are found
+    
+    Each line is flushed when written, so the file can be followed with
+    tail -f while a scan is running.
+    """
+    def __init__(self, filename: str):
+        self.filename = filename
+    
+    def begin(self, domain: str, timestamp: str):
+        self._file = open(self.filename, 'wb')
+    
+    def write(self, scope: str, name: str, record_type: str, entry: RecordSet):
+        record = {'domain': name, 'type': record_type, 'values': entry.values}
+        if orjson is not None:
+            line = orjson.dumps(record)
+        else:
+            line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._file.write(line + b'\n')
+        self._file.flush()
+    
+    def end(self):
+        self._file.close()
+        print(f"JSONL output saved to: {self.filename}")
+
+# Batched UDP syscalls: sendmmsg(2)/recvmmsg(2) are Linux-only, other
+# platforms send and receive one datagram per call
+_libc = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+        _libc.recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    except (OSError, AttributeError):
+        _libc = None
+
+# Upper bound on datagrams per sendmmsg/recvmmsg call
+MMSG_BATCH = 64
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+def _pack_sockaddr(family: int, address: str, port: int) -> bytes:
+    """Build a raw sockaddr_in/sockaddr_in6 for address and port"""
+    packed = socket.inet_pton(family, address)
+    if family == socket.AF_INET6:
+        return struct.pack('=H', family) + struct.pack('!HI', port, 0) + packed + struct.pack('=I', 0)
+    return struct.pack('=H', family) + struct.pack('!H', port) + packed + bytes(8)
+
+def _unpack_sockaddr(raw: bytes) -> Tuple[str, int]:
+    """Return (address, port) from a raw sockaddr_in/sockaddr_in6"""
+    family = struct.unpack_from('=H', raw)[0]
+    port = struct.unpack_from('!H', raw, 2)[0]
+    if family == socket.AF_INET6:
+        return socket.inet_ntop(family, raw[8:24]), port
+    return socket.inet_ntop(socket.AF_INET, raw[4:8]), port
+
+def _raise_errno():
+    err = ctypes.get_errno()
+    # EAGAIN comes back as BlockingIOError
+    raise OSError(err, os.strerror(err))
+
+def _sendmmsg(fd: int, packets: List[Tuple[bytes, bytes]]) -> int:
+    """Send (wire, sockaddr) datagrams with one sendmmsg call; returns how many were sent"""
+    count = len(packets)
+    msgs = (_MMsgHdr * count)()
+    iovs = (_IOVec * count)()
+    buffers = []
+    for i, (wire, name) in enumerate(packets):
+        data = ctypes.create_string_buffer(wire, len(wire))
+        addr = ctypes.create_string_buffer(name, len(name))
+        buffers.append((data, addr))
+        iovs[i].iov_base = ctypes.addressof(data)
+        iovs[i].iov_len = len(wire)
+        hdr = msgs[i].msg_hdr
+        hdr.msg_name = ctypes.addressof(addr)
+        hdr.msg_namelen = len(name)
+        hdr.msg_iov = ctypes.pointer(iovs[i])
+        hdr.msg_iovlen = 1
+    sent = _libc.sendmmsg(fd, msgs, count, 0)
+    if sent < 0:
+        _raise_errno()
+    return sent
+
+class _MMsgReceiver:
+    """Preallocated buffers for draining a socket with recvmmsg"""
+    def __init__(self, batch: int = MMSG_BATCH, size: int = 4096):
+        self.batch = batch
+        self._buffers = [ctypes.create_string_buffer(size) for _ in range(batch)]
+        # Large enough for a sockaddr_in6
+        self._names = [ctypes.create_string_buffer(128) for _ in range(batch)]
+        self._iovs = (_IOVec * batch)()
+        self._msgs = (_MMsgHdr * batch)()
+        for i in range(batch):
+            self._iovs[i].iov_base = ctypes.addressof(self._buffers[i])
+            self._iovs[i].iov_len = size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self._names[i])
+            hdr.msg_iov = ctypes.pointer(self._iovs[i])
+            hdr.msg_iovlen = 1
+    
+    def receive(self, fd: int) -> List[Tuple[bytes, Tuple[str, int]]]:
+        """Read up to batch datagrams in one call; raises BlockingIOError when none are queued"""
+        for i in range(self.batch):
+            self._msgs[i].msg_hdr.msg_namelen = len(self._names[i])
+        count = _libc.recvmmsg(fd, self._msgs, self.batch, 0, None)
+        if count < 0:
+            _raise_errno()
+        return [
+            (ctypes.string_at(self._buffers[i], self._msgs[i].msg_len),
+             _unpack_sockaddr(self._names[i].raw[:self._msgs[i].msg_hdr.msg_namelen]))
+            for i in range(count)
         ]
+
+class UDPQueryMux:
+    """Multiplex DNS queries over one persistent UDP socket per address family
+    
+    Replies are matched to their queries by nameserver address, port and
+    transaction ID, so any number of queries can share the socket. Queries
+    issued in the same event loop iteration are sent with a single
+    sendmmsg call and replies are drained with recvmmsg where available.
+    """
+    def __init__(self):
+        self._loop = None
+        self._sockets = {}
+        self._outbox = {}
+        self._pending = {}
+        self._receiver = _MMsgReceiver() if _libc is not None else None
+    
+    def _socket(self, family: int) -> socket.socket:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sockets are registered with the event loop that created them
+            self.close()
+            self._loop = loop
+        sock = self._sockets.get(family)
+        if sock is None:
+            sock = socket.socket(family, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            loop.add_reader(sock.fileno(), self._on_readable, sock)
+            self._sockets[family] = sock
+            self._outbox[family] = []
+        return sock
+    
+    def close(self):
+        """Close the shared sockets; they are reopened on the next query"""
+        for sock in self._sockets.values():
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.remove_reader(sock.fileno())
+                self._loop.remove_writer(sock.fileno())
+            sock.close()
+        self._sockets = {}
+        self._outbox = {}
+        self._loop = None
+    
+    async def query(self, request: dns.message.Message, address: str, port: int, timeout: float) -> dns.message.Message:
+        """Send request to address:port and wait up to timeout seconds for the reply"""
+        address = ipaddress.ip_address(address).compressed
+        family = socket.AF_INET6 if ':' in address else socket.AF_INET
+        # Resolve the destination here so an address that cannot be used
+        # (e.g. a scoped IPv6 address) fails only this query
+        target = _pack_sockaddr(family, address, port) if _libc is not None else (address, port)
+        self._socket(family)
         
-        # RFC-defined service discovery subdomains (underscore prefixed)
-        self.rfc_subdomains = [
-            # Email and messaging (RFC 6186, RFC 8314)
-            '_submission._tcp', '_submissions._tcp', '_imap._tcp', '_imaps._tcp',
-            '_pop3._tcp', '_pop3s._tcp', '_smtp._tcp', '_smtps._tcp',
-            
-            # SIP and VoIP (RFC 3263, RFC 5630)
-            '_sip._tcp', '_sip._udp', '_sips._tcp', '_sips._udp',
-            
-            # XMPP/Jabber (RFC 6120)
-            '_xmpp-client._tcp', '_xmpp-server._tcp', '_xmpps-client._tcp', '_xmpps-server._tcp',
-            
-            # HTTP services (RFC 2782, RFC 6763)
-            '_http._tcp', '_https._tcp',
-            
-            # FTP services
-            '_ftp._tcp', '_ftps._tcp',
-            
-            # LDAP services (RFC 2782)
-            '_ldap._tcp', '_ldaps._tcp',
-            
-            # Kerberos (RFC 4120)
-            '_kerberos._tcp', '_kerberos._udp', '_kpasswd._tcp', '_kpasswd._udp',
-            
-            # DNS services
-            '_dns._tcp', '_dns._udp',
-            
-            # NTP (Network Time Protocol)
-            '_ntp._udp',
-            
-            # CalDAV and CardDAV (RFC 6764)
-            '_caldav._tcp', '_caldavs._tcp', '_carddav._tcp', '_carddavs._tcp',
-            
-            # WebDAV
-            '_webdav._tcp', '_webdavs._tcp',
-            
-            # SSH and SFTP
-            '_ssh._tcp', '_sftp._tcp',
-            
-            # Matrix protocol
-            '_matrix._tcp', '_matrix-fed._tcp',
-            
-            # Minecraft
-            '_minecraft._tcp',
-            
-            # TeamSpeak
-            '_ts3._udp',
-            
-            # Common email security and configuration records
-            '_dmarc', '_domainkey', '_adsp._domainkey',
-            
-            # SPF and email authentication
-            '_spf',
-            
-            # Microsoft/Office 365 specific
-            '_autodiscover._tcp', '_sip._tls',
-            
-            # Apple specific
-            '_apple-challenge',
-            
-            # Google specific
-            '_google-site-verification',
-            
-            # Certificate Authority Authorization related
-            '_caa',
-            
-            # ACME challenge (Let's Encrypt)
-            '_acme-challenge'
-        ]
+        # Pick a fresh transaction ID if this one is already in flight
+        key = (address, port, request.id)
+        while key in self._pending:
+            request.id = dns.entropy.random_16()
+            key = (address, port, request.id)
         
+        future = self._loop.create_future()
+        self._pending[key] = (request, future)
+        try:
+            outbox = self._outbox[family]
+            outbox.append((request.to_wire(), target, future))
+            if len(outbox) == 1:
+                # First packet of this loop iteration; send the batch once it is complete
+                self._loop.call_soon(self._flush, family)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise dns.exception.Timeout(timeout=timeout)
+        finally:
+            del self._pending[key]
+    
+    def _flush(self, family: int):
+        """Send queued datagrams, waiting for the socket to become writable if needed"""
+        sock = self._sockets.get(family)
+        if sock is None:
+            return
+        outbox = self._outbox[family]
+        # Skip queries that timed out before they were sent
+        outbox[:] = [packet for packet in outbox if not packet[2].done()]
+        while outbox:
+            try:
+                if _libc is not None:
+                    batch = [(wire, target) for wire, target, _ in outbox[:MMSG_BATCH]]
+                    sent = _sendmmsg(sock.fileno(), batch)
+                else:
+                    wire, target, _ = outbox[0]
+                    sock.sendto(wire, target)
+                    sent = 1
+            except BlockingIOError:
+                break
+            except OSError as e:
+                # The first datagram could not be sent; fail its query and go on
+                future = outbox.pop(0)[2]
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            except Exception as e:
+                # Anything else fails every queued query; a stuck outbox
+                # would stop all later sends
+                for _, _, future in outbox:
+                    if not future.done():
+                        future.set_exception(e)
+                outbox.clear()
+                break
+            del outbox[:sent]
+        if outbox:
+            self._loop.add_writer(sock.fileno(), self._flush, family)
+        else:
+            self._loop.remove_writer(sock.fileno())
+    
+    def _on_readable(self, sock: socket.socket):
+        """Drain every datagram waiting on the socket"""
+        while True:
+            try:
+                if self._receiver is not None:
+                    datagrams = self._receiver.receive(sock.fileno())
+                else:
+                    datagrams = [sock.recvfrom(65535)]
+            except OSError:
+                # Nothing left to read (or a transient socket error)
+                return
+            for data, addr in datagrams:
+                self._dispatch(data, addr)
+            if self._receiver is not None and len(datagrams) < self._receiver.batch:
+                return
+    
+    def _dispatch(self, data: bytes, addr):
+        try:
+            response = dns.message.from_wire(data)
+        except dns.exception.DNSException:
+            # Garbage on the socket; the matching query will time out
+            return
+        entry = self._pending.get((ipaddress.ip_address(addr[0]).compressed, addr[1], response.id))
+        if entry is None:
+            return
+        request, future = entry
+        if not future.done() and request.is_response(response):
+            future.set_result(response)
+
+class SharedSocketNameserver(dns.nameserver.Do53Nameserver):
+    """Plain DNS nameserver whose UDP queries go through a shared UDPQueryMux"""
+    def __init__(self, address: str, mux: UDPQueryMux, port: int = 53):
+        super().__init__(address, port)
+        self.mux = mux
+    
+    async def async_query(self, request, timeout, source, source_port, max_size, backend,
+                          one_rr_per_rrset=False, ignore_trailing=False):
+        if max_size:
+            # TCP retries after truncation keep dnspython's own transport
+            return await super().async_query(request, timeout, source, source_port, max_size,
+                                             backend, one_rr_per_rrset, ignore_trailing)
+        response = await self.mux.query(request, self.address, self.port, timeout)
+        if response.flags & dns.flags.TC:
+            raise dns.message.Truncated(message=response)
+        return response
+
+# Cache lifetimes in seconds: positive answers keep their TTL up to the
+# cap, NXDOMAIN / no-answer results are kept for a short fixed time
+MAX_CACHE_TTL = 3600
+NEGATIVE_CACHE_TTL = 30
+
+# Default nameservers queries are spread across; providers alternate so
+# that racing the first few (--replicate) reaches different operators
+PUBLIC_RESOLVERS = ['8.8.8.8', '1.1.1.1', '9.9.9.9', '8.8.4.4', '1.0.0.1']
+
+# Record types queried for the main domain
+COMMON_RECORD_TYPES = (
+    'A', 'AAAA', 'CNAME', 'MX', 'NS', 'TXT', 'SOA', 
+    'PTR', 'SRV', 'CAA', 'DNSKEY', 'DS'
+)
+
+# Record types queried for subdomains (most relevant)
+SUBDOMAIN_RECORD_TYPES = ('A', 'AAAA', 'CNAME')
+
+# Main domain record types that also get dig-style detailed output
+DETAILED_RECORD_TYPES = ('SOA', 'NS', 'MX')
+
+# Standard web and service subdomains
+STANDARD_SUBDOMAINS = (
+    'www', 'mail', 'ftp', 'smtp', 'pop', 'imap', 'webmail',
+    'admin', 'blog', 'shop', 'store', 'api', 'cdn', 'static',
+    'img', 'images', 'assets', 'files', 'download', 'uploads',
+    'dev', 'test', 'staging', 'beta', 'demo', 'support',
+    'help', 'docs', 'wiki', 'forum', 'news', 'mobile',
+    'app', 'secure', 'vpn', 'remote', 'portal', 'login',
+    'cpanel', 'whm', 'ns1', 'ns2', 'mx1', 'mx2'
+)
+
+# RFC-defined service discovery subdomains (underscore prefixed)
+RFC_SUBDOMAINS = (
+    # Email and messaging (RFC 6186, RFC 8314)
+    '_submission._tcp', '_submissions._tcp', '_imap._tcp', '_imaps._tcp',
+    '_pop3._tcp', '_pop3s._tcp', '_smtp._tcp', '_smtps._tcp',
+
+    # SIP and VoIP (RFC 3263, RFC 5630)
+    '_sip._tcp', '_sip._udp', '_sips._tcp', '_sips._udp',
+
+    # XMPP/Jabber (RFC 6120)
+    '_xmpp-client._tcp', '_xmpp-server._tcp', '_xmpps-client._tcp', '_xmpps-server._tcp',
+
+    # HTTP services (RFC 2782, RFC 6763)
+    '_http._tcp', '_https._tcp',
+
+    # FTP services
+    '_ftp._tcp', '_ftps._tcp',
+
+    # LDAP services (RFC 2782)
+    '_ldap._tcp', '_ldaps._tcp',
+
+    # Kerberos (RFC 4120)
+    '_kerberos._tcp', '_kerberos._udp', '_kpasswd._tcp', '_kpasswd._udp',
+
+    # DNS services
+    '_dns._tcp', '_dns._udp',
+
+    # NTP (Network Time Protocol)
+    '_ntp._udp',
+
+    # CalDAV and CardDAV (RFC 6764)
+    '_caldav._tcp', '_caldavs._tcp', '_carddav._tcp', '_carddavs._tcp',
+
+    # WebDAV
+    '_webdav._tcp', '_webdavs._tcp',
+
+    # SSH and SFTP
+    '_ssh._tcp', '_sftp._tcp',
+
+    # Matrix protocol
+    '_matrix._tcp', '_matrix-fed._tcp',
+
+    # Minecraft
+    '_minecraft._tcp',
+
+    # TeamSpeak
+    '_ts3._udp',
+
+    # Common email security and configuration records
+    '_dmarc', '_domainkey', '_adsp._domainkey',
+
+    # SPF and email authentication
+    '_spf',
+
+    # Microsoft/Office 365 specific
+    '_autodiscover._tcp', '_sip._tls',
+
+    # Apple specific
+    '_apple-challenge',
+
+    # Google specific
+    '_google-site-verification',
+
+    # Certificate Authority Authorization related
+    '_caa',
+
+    # ACME challenge (Let's Encrypt)
+    '_acme-challenge'
+)
+
+# Combined list, plus set views for O(1) membership checks
+COMMON_SUBDOMAINS = STANDARD_SUBDOMAINS + RFC_SUBDOMAINS
+STANDARD_SUBDOMAINS_SET = frozenset(STANDARD_SUBDOMAINS)
+COMMON_SUBDOMAINS_SET = frozenset(COMMON_SUBDOMAINS)
+
+class DNSDumper:
+    def __init__(self, timeout: float = 0.5, max_workers: int = 64, replicate: int = 1,
+                 nameservers: Optional[List[str]] = None, attempts: int = 3, use_any: bool = False,
+                 verbose: bool = True, cache_file: Optional[str] = None, wildcard_check: bool = True):
+        # Built-in lists are shared module-level constants
+        self.common_record_types = COMMON_RECORD_TYPES
+        self.standard_subdomains = STANDARD_SUBDOMAINS
+        self.rfc_subdomains = RFC_SUBDOMAINS
         # Combined list (for backward compatibility)
-        self.common_subdomains = self.standard_subdomains + self.rfc_subdomains
+        self.common_subdomains = COMMON_SUBDOMAINS
+        
+        # In-process async resolvers, one per nameserver ("address" or
+        # "address#port"); all UDP queries share one socket via the mux
+        self.udp_mux = UDPQueryMux()
+        self.resolvers = []
+        endpoints = []
+        for nameserver in nameservers or PUBLIC_RESOLVERS:
+            address, _, port = nameserver.partition('#')
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = [SharedSocketNameserver(address, self.udp_mux, int(port or 53))]
+            self.resolvers.append(resolver)
+            endpoints.append(f"{address}#{int(port or 53)}")
+        # Primary resolver; lookups are spread over all of them by name
+        self.resolver = self.resolvers[0]
+        # Timeout of the first attempt; each retry doubles it (0.5s, 1s, 2s by default)
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        # Number of resolvers each A/AAAA/CNAME query is raced across; other
+        # record types (SOA, NS, ...) go to a single resolver
+        self.replicate = max(1, min(replicate, len(self.resolvers)))
+        self.replicated_record_types = SUBDOMAIN_RECORD_TYPES
+        # Answers (and negative results) keyed by (name, record_type)
+        self.cache = TTLCache()
+        # Optional on-disk copy of the cache, shared between runs
+        self.disk_cache = None
+        if cache_file:
+            try:
+                # Answers are only reused with the same set of nameservers
+                self.disk_cache = DiskCache(cache_file, ' '.join(sorted(set(endpoints))))
+                loaded = self.disk_cache.load(self.cache)
+            except sqlite3.Error as e:
+                print(f"Error opening cache file '{cache_file}': {e}. Continuing without it.")
+                self.disk_cache = None
+            else:
+                if verbose:
+                    print(f"Loaded {loaded} cached answers from {cache_file}")
+        # Try one ANY query for the main domain before the per-type queries
+        self.use_any = use_any
+        # Maximum number of queries in flight at once
+        self.max_workers = max_workers
+        # Print scan progress; when off, progress lines are never formatted
+        self.verbose = verbose
+        # Probe a random label before the subdomain scan and drop names that
+        # only return the wildcard records
+        self.wildcard_check = wildcard_check
     
     def load_custom_subdomains(self, filename: str) -> List[str]:
         """Load custom subdomains from a file"""
@@ -111,7 +713,8 @@ class DNSDumper:
                     # Skip empty lines and comments
                     if subdomain and not subdomain.startswith('#'):
                         custom_subdomains.append(subdomain)
-            print(f"Loaded {len(custom_subdomains)} custom subdomains from {filename}")
+            if self.verbose:
+                print(f"Loaded {len(custom_subdomains)} custom subdomains from {filename}")
         except FileNotFoundError:
             print(f"Warning: Custom subdomain file '{filename}' not found. Using default list only.")
         except Exception as e:
@@ -122,10 +725,11 @@ class DNSDumper:
         """Get the complete list of subdomains to check and full domains to check"""
         # Choose which subdomains to include
         if skip_rfc:
-            subdomains = self.standard_subdomains.copy()
-            print(f"Skipping RFC subdomains (using {len(subdomains)} standard subdomains)")
+            subdomains = list(STANDARD_SUBDOMAINS)
+            if self.verbose:
+                print(f"Skipping RFC subdomains (using {len(subdomains)} standard subdomains)")
         else:
-            subdomains = self.common_subdomains.copy()
+            subdomains = list(COMMON_SUBDOMAINS)
         
         full_domains = []
         
@@ -134,66 +738,344 @@ class DNSDumper:
             # Separate regular subdomains from full domain names
             added_count = 0
             full_domain_count = 0
+            # Built-ins are checked against the precomputed frozensets, custom
+            # additions against a small set of their own
+            builtin_set = STANDARD_SUBDOMAINS_SET if skip_rfc else COMMON_SUBDOMAINS_SET
+            added_set = set()
+            full_domains_set = set()
+            # DNS names are case-insensitive; compare everything in lower case
+            target_lower = target_domain.lower() if target_domain else None
+            suffix = '.' + target_lower if target_lower else None
             
             for item in custom_subdomains:
-                # Check if it's a full domain (contains dots)
-                if '.' in item:
-                    # If it ends with the target domain, it's a multi-level subdomain
-                    if target_domain and item.endswith('.' + target_domain):
-                        full_domains.append(item)
-                        full_domain_count += 1
-                    # If it doesn't contain the target domain at all, it's a completely different domain
-                    elif target_domain and target_domain not in item:
-                        full_domains.append(item)
-                        full_domain_count += 1
-                    # If it contains the target domain but doesn't end with it, it's also a full domain
-                    elif target_domain and target_domain in item and not item.endswith(target_domain):
+                item = item.lower()
+                # Dotted items are full domains unless they only end in the target domain
+                # without a separating dot (e.g. the target domain itself)
+                if ('.' in item and target_lower
+                        and not (item.endswith(target_lower) and not item.endswith(suffix))):
+                    if item not in full_domains_set:
+                        full_domains_set.add(item)
                         full_domains.append(item)
                         full_domain_count += 1
-                    else:
-                        # It's just a regular subdomain with dots
-                        if item not in subdomains:
-                            subdomains.append(item)
-                            added_count += 1
-                elif item not in subdomains:
+                elif item not in builtin_set and item not in added_set:
+                    added_set.add(item)
                     subdomains.append(item)
                     added_count += 1
             
-            print(f"Added {added_count} new subdomains and {full_domain_count} full domains from custom list")
-            print(f"Total: {len(subdomains)} subdomains, {len(full_domains)} full domains")
-        else:
+            if self.verbose:
+                print(f"Added {added_count} new subdomains and {full_domain_count} full domains from custom list")
+                print(f"Total: {len(subdomains)} subdomains, {len(full_domains)} full domains")
+        elif self.verbose:
             print(f"Using built-in subdomain list ({len(subdomains)} subdomains)")
         
         return subdomains, full_domains
         
-    def run_dig_command(self, domain: str, record_type: str) -> Optional[str]:
-        """Run dig command and return output"""
+    async def _aresolve(self, name: str, record_type: str, sem: asyncio.Semaphore) -> dns.resolver.Answer:
+        """Resolve a single name/record type, bounded by the shared semaphore"""
+        key = (name, record_type)
+        answer = self.cache.get(key)
+        if answer is None:
+            try:
+                async with sem:
+                    if self.replicate > 1 and record_type in self.replicated_record_types:
+                        answer = await self._race(name, record_type)
+                    else:
+                        answer = await self._resolve_with_retries(self._resolvers_for(name)[0], name, record_type)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                # Negative answers are cached too, for a short fixed time
+                self.cache.set(key, e, NEGATIVE_CACHE_TTL)
+                raise
+            self.cache.set(key, answer, min(answer.rrset.ttl, MAX_CACHE_TTL))
+        elif isinstance(answer, dns.exception.DNSException):
+            # Cached NXDOMAIN / no answer
+            raise answer.with_traceback(None)
+        return answer
+    
+    async def _resolve_with_retries(self, resolver: dns.asyncresolver.Resolver, name: str, record_type: str) -> dns.resolver.Answer:
+        """Resolve with a short first timeout, doubling it on every retry"""
+        timeout = self.timeout
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await resolver.resolve(name, record_type, lifetime=timeout)
+            except dns.exception.Timeout:
+                if attempt == self.attempts:
+                    raise
+                timeout *= 2
+    
+    async def _iter_completed(self, jobs: Iterable[Tuple[int, Awaitable]]) -> AsyncIterator[Tuple[int, object]]:
+        """Yield (index, result) for (index, awaitable) jobs as they complete
+        
+        Jobs are taken from the iterable lazily and started as tasks, never
+        more than max_workers at a time, and a new one starts as soon as any
+        finishes, so a slow job only holds up its own slot. Failed jobs
+        yield their exception.
+        """
+        pending = {}
+        # Finished tasks are pushed here by their done callback
+        done_queue = asyncio.Queue()
+        
+        def finished(task):
+            return pending.pop(task), task.exception() or task.result()
+        
         try:
-            # Use faster dig options: +short, +time=2, +tries=1
-            cmd = ['dig', '+short', '+time=2', '+tries=1', f'@8.8.8.8', domain, record_type]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            # Silently skip timeouts to avoid spam
-            pass
-        except FileNotFoundError as e:
-            print(f"Error: dig command not found: {e}", file=sys.stderr)
+            for index, job in jobs:
+                while len(pending) >= self.max_workers:
+                    yield finished(await done_queue.get())
+                task = asyncio.ensure_future(job)
+                task.add_done_callback(done_queue.put_nowait)
+                pending[task] = index
+            while pending:
+                yield finished(await done_queue.get())
+        finally:
+            # Only reached with tasks left if the consumer stopped early
+            for task in pending:
+                task.cancel()
+    
+    async def _iter_resolved(self, lookups: List[Tuple[str, str]], sem: asyncio.Semaphore) -> AsyncIterator[Tuple[int, object]]:
+        """Yield (index, result) for (name, record_type) lookups as they complete
+        
+        Cache hits (including cached negative results) are yielded directly
+        without creating a task; misses go through _iter_completed.
+        """
+        misses = []
+        for index, lookup in enumerate(lookups):
+            cached = self.cache.get(lookup)
+            if cached is not None:
+                yield index, cached
+            else:
+                misses.append((index, lookup))
+        async for item in self._iter_completed((index, self._aresolve(*lookup, sem)) for index, lookup in misses):
+            yield item
+    
+    def _resolvers_for(self, name: str, count: int = 1) -> List[dns.asyncresolver.Resolver]:
+        """Pick count resolvers for name, starting from one chosen by a stable hash
+        
+        Spreading names over all nameservers keeps any single one below its
+        rate limit, and sending every lookup for a name to the same place
+        lets that resolver answer repeats from its own cache.
+        """
+        start = zlib.crc32(name.lower().encode('utf-8')) % len(self.resolvers)
+        return [self.resolvers[(start + i) % len(self.resolvers)] for i in range(count)]
+    
+    async def _race(self, name: str, record_type: str) -> dns.resolver.Answer:
+        """Send the same query to several resolvers and return the first answer"""
+        tasks = [asyncio.ensure_future(self._resolve_with_retries(resolver, name, record_type))
+                 for resolver in self._resolvers_for(name, self.replicate)]
+        try:
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if isinstance(error, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)):
+                        # A definitive negative answer ends the race as well
+                        raise error
+            # Every resolver failed (timeouts, SERVFAIL, ...)
+            raise error
+        finally:
+            # Cancel the stragglers and discard their results. A straggler
+            # whose reply is already in flight can still finish with an
+            # exception instead of being cancelled, so retrieve it once done
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    
+    def format_detailed(self, answer: dns.resolver.Answer) -> str:
+        """Render a resolver answer in dig's detailed output layout"""
+        response = answer.response
+        lines = [
+            f";; ->>HEADER<<- opcode: {dns.opcode.to_text(response.opcode())}, "
+            f"status: {dns.rcode.to_text(response.rcode())}, id: {response.id}",
+            f";; flags: {dns.flags.to_text(response.flags).lower()}; "
+            f"QUERY: {len(response.question)}, ANSWER: {sum(len(r) for r in response.answer)}, "
+            f"AUTHORITY: {sum(len(r) for r in response.authority)}, "
+            f"ADDITIONAL: {sum(len(r) for r in response.additional)}",
+            "",
+            ";; QUESTION SECTION:",
+        ]
+        lines.extend(f";{rrset.to_text()}" for rrset in response.question)
+        for title, section in (('ANSWER', response.answer), ('AUTHORITY', response.authority),
+                               ('ADDITIONAL', response.additional)):
+            if section:
+                lines.append("")
+                lines.append(f";; {title} SECTION:")
+                lines.extend(rrset.to_text() for rrset in section)
+        if answer.nameserver:
+            lines.append("")
+            lines.append(f";; SERVER: {answer.nameserver}#{answer.port}")
+        return '\n'.join(lines) + '\n'
+    
+    async def _try_any(self, name: str, record_types: Iterable[str], sem: asyncio.Semaphore) -> Dict[str, dns.resolver.Answer]:
+        """Fetch a name's records with a single ANY query
+        
+        The response is split into per-type answers for record_types, as if
+        each type had been queried on its own, and cached. An NXDOMAIN reply
+        is cached as NXDOMAIN for all of record_types. Returns an empty dict if
+        the resolver refuses ANY (e.g. the RFC 8482 HINFO reply), the name does
+        not exist or the query fails, so the caller can fall back to per-type
+        queries.
+        """
+        # dnspython's resolver refuses meta-queries, so talk to the nameserver directly
+        nameserver = self._resolvers_for(name)[0].nameservers[0]
+        backend = dns.asyncbackend.get_default_backend()
+        timeout = sum(self.timeout * 2 ** i for i in range(self.attempts))
+        request = dns.message.make_query(name, dns.rdatatype.ANY, use_edns=0, payload=1232)
+        try:
+            async with sem:
+                try:
+                    response = await nameserver.async_query(request, timeout, None, 0, False, backend)
+                except dns.message.Truncated:
+                    response = await nameserver.async_query(request, timeout, None, 0, True, backend)
+        except (dns.exception.DNSException, OSError):
+            return {}
+        
+        qname = request.question[0].name
+        if response.rcode() == dns.rcode.NXDOMAIN:
+            # The name does not exist, whatever the record type
+            error = dns.resolver.NXDOMAIN(qnames=[qname], responses={qname: response})
+            for record_type in record_types:
+                self.cache.set((name, record_type), error, NEGATIVE_CACHE_TTL)
+            return {}
+        rrsets = [rrset for rrset in response.answer if rrset.name == qname]
+        if response.rcode() != dns.rcode.NOERROR or not rrsets:
+            return {}
+        if all(rrset.rdtype == dns.rdatatype.HINFO for rrset in rrsets):
+            # RFC 8482 minimal response instead of the real records
+            return {}
+        
+        answers = {}
+        for rrset in rrsets:
+            record_type = dns.rdatatype.to_text(rrset.rdtype)
+            if record_type not in record_types:
+                continue
+            answer = self._answer_from_rrset(rrset, response, nameserver.answer_nameserver(),
+                                             nameserver.answer_port())
+            self.cache.set((name, record_type), answer, min(rrset.ttl, MAX_CACHE_TTL))
+            answers[record_type] = answer
+        return answers
+    
+    @staticmethod
+    def _answer_from_rrset(rrset, response: dns.message.Message, nameserver: Optional[str] = None,
+                           port: Optional[int] = None) -> dns.resolver.Answer:
+        """Wrap one RRset of a response as if it answered a query for its own type"""
+        single = dns.message.make_response(dns.message.make_query(rrset.name, rrset.rdtype))
+        single.id = response.id
+        single.flags = response.flags
+        # The RRset itself is a positive answer, even when it came from an
+        # NXDOMAIN reply (a CNAME to a name that does not exist)
+        single.set_rcode(dns.rcode.NOERROR)
+        single.find_rrset(single.answer, rrset.name, rrset.rdclass, rrset.rdtype, create=True).update(rrset)
+        return dns.resolver.Answer(rrset.name, rrset.rdtype, rrset.rdclass, single, nameserver, port)
+    
+    @staticmethod
+    def _outcome_response(outcome) -> Optional[dns.message.Message]:
+        """Return the response behind a lookup result or error, if it is known"""
+        if isinstance(outcome, dns.resolver.Answer):
+            return outcome.response
+        if isinstance(outcome, dns.resolver.NXDOMAIN):
+            return next(iter(outcome.kwargs.get('responses', {}).values()), None)
+        if isinstance(outcome, dns.resolver.NoAnswer):
+            return outcome.kwargs.get('response')
         return None
     
-    def get_detailed_record(self, domain: str, record_type: str) -> Optional[str]:
-        """Get detailed record information"""
+    async def _probe_subdomain(self, name: str, sem: asyncio.Semaphore):
+        """Look up a subdomain's A record and cache what the reply implies for the other types
+        
+        A resolver answering an A query follows the name's CNAME, so the
+        reply shows whether the name has one. Without a CNAME, an NXDOMAIN
+        means the name has no AAAA record either. Returns the A answer or
+        the lookup error.
+        """
+        if self.use_any:
+            await self._try_any(name, SUBDOMAIN_RECORD_TYPES, sem)
+        try:
+            outcome = await self._aresolve(name, 'A', sem)
+        except dns.exception.DNSException as e:
+            outcome = e
+        
+        response = self._outcome_response(outcome)
+        if response is not None and self.cache.get((name, 'CNAME')) is None:
+            qname = dns.name.from_text(name)
+            cname = response.get_rrset(response.answer, qname, dns.rdataclass.IN, dns.rdatatype.CNAME)
+            if cname is not None:
+                self.cache.set((name, 'CNAME'), self._answer_from_rrset(cname, response),
+                               min(cname.ttl, MAX_CACHE_TTL))
+            elif isinstance(outcome, dns.resolver.NXDOMAIN):
+                self.cache.set((name, 'AAAA'), outcome, NEGATIVE_CACHE_TTL)
+                self.cache.set((name, 'CNAME'), outcome, NEGATIVE_CACHE_TTL)
+            else:
+                self.cache.set((name, 'CNAME'), dns.resolver.NoAnswer(response=response), NEGATIVE_CACHE_TTL)
+        return outcome
+    
+    async def _resolve_subdomain(self, name: str, sem: asyncio.Semaphore) -> List[object]:
+        """Resolve every SUBDOMAIN_RECORD_TYPES type of a name, in that order
+        
+        The probe runs first; the types it did not settle are then queried
+        together. Each entry is the lookup result or its exception.
+        """
+        outcome = await self._probe_subdomain(name, sem)
+        others = [rt for rt in SUBDOMAIN_RECORD_TYPES if rt != 'A']
+        results = dict(zip(others, await asyncio.gather(
+            *(self._aresolve(name, rt, sem) for rt in others), return_exceptions=True)))
+        results['A'] = outcome
+        return [results[rt] for rt in SUBDOMAIN_RECORD_TYPES]
+    
+    def _result_values(self, result) -> Optional[List[str]]:
+        """Turn a gathered lookup result into a list of record values"""
+        if result is None or isinstance(result, dns.exception.DNSException):
+            # NXDOMAIN, no answer, timeouts etc. simply mean "no records"
+            return None
+        if isinstance(result, BaseException):
+            raise result
+        return [rdata.to_text() for rdata in result]
+
+    def extract_dns_records(self, domain: str, include_subdomains: bool = True, custom_subdomain_file: Optional[str] = None, skip_rfc_subdomains: bool = False, writers: Iterable = ()) -> Union[Dict, Awaitable[Dict]]:
+        """Extract all DNS records for a domain and its subdomains
+        
+        Runs its own event loop and returns the records. When called from
+        inside a running event loop it returns the extract_dns_records_async
+        coroutine to await instead; call close() (or use the dumper as an
+        async context manager) once done with that loop.
+        """
         try:
-            cmd = ['dig', f'@8.8.8.8', domain, record_type]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                return result.stdout
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            asyncio.get_running_loop()
+        except RuntimeError:
             pass
-        return None
+        else:
+            return self.extract_dns_records_async(
+                domain, include_subdomains, custom_subdomain_file, skip_rfc_subdomains, writers
+            )
+        
+        async def run():
+            try:
+                return await self.extract_dns_records_async(
+                    domain, include_subdomains, custom_subdomain_file, skip_rfc_subdomains, writers
+                )
+            finally:
+                # The shared sockets belong to this event loop
+                self.close()
+        return asyncio.run(run())
+    
+    def close(self):
+        """Close the shared query sockets; a later lookup reopens them"""
+        self.udp_mux.close()
+    
+    async def __aenter__(self) -> 'DNSDumper':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
 
-    def extract_dns_records(self, domain: str, include_subdomains: bool = True, custom_subdomain_file: Optional[str] = None, skip_rfc_subdomains: bool = False) -> Dict:
-        """Extract all DNS records for a domain and its subdomains"""
+    async def extract_dns_records_async(self, domain: str, include_subdomains: bool = True, custom_subdomain_file: Optional[str] = None, skip_rfc_subdomains: bool = False, writers: Iterable = ()) -> Dict:
+        """Extract all DNS records for a domain and its subdomains concurrently
+        
+        Records are handed to each of the given stream writers as they are
+        found, and aggregated into the returned dict.
+        """
         records = {
             'domain': domain,
             'timestamp': datetime.now().isoformat(),
@@ -201,90 +1083,173 @@ class DNSDumper:
             'subdomains': {}
         }
         
-        print(f"Extracting DNS records for: {domain}")
+        # Running totals so the summary does not have to walk the results
+        stats = records['_stats'] = {'main_records': 0, 'subdomain_records': 0, 'subdomains_hit': 0}
         
-        # Extract records for main domain
-        print(f"\n--- Main domain: {domain} ---")
-        for record_type in self.common_record_types:
-            print(f"  Checking {record_type} records...", end='')
+        writers = list(writers)
+        for writer in writers:
+            writer.begin(records['domain'], records['timestamp'])
+        try:
+            async for scope, name, record_type, entry in self.iter_dns_records_async(
+                    domain, include_subdomains, custom_subdomain_file, skip_rfc_subdomains):
+                for writer in writers:
+                    writer.write(scope, name, record_type, entry)
+                if scope == 'records':
+                    records['records'][record_type] = entry
+                    stats['main_records'] += entry.count
+                else:
+                    subdomain_records = records['subdomains'].get(name)
+                    if subdomain_records is None:
+                        subdomain_records = records['subdomains'][name] = {}
+                        stats['subdomains_hit'] += 1
+                    subdomain_records[record_type] = entry
+                    stats['subdomain_records'] += entry.count
+        finally:
+            for writer in writers:
+                writer.end()
+            if self.disk_cache is not None:
+                self.disk_cache.save(self.cache)
+        
+        return records
+
+    async def iter_dns_records_async(self, domain: str, include_subdomains: bool = True, custom_subdomain_file: Optional[str] = None, skip_rfc_subdomains: bool = False) -> AsyncIterator[Tuple[str, str, str, RecordSet]]:
+        """Yield (scope, name, record_type, entry) for every record set found
+        
+        scope is 'records' for the main domain and 'subdomains' otherwise.
+        Main domain records come first. Subdomains follow in the order their
+        lookups complete, with all record types of a subdomain yielded together.
+        """
+        verbose = self.verbose
+        if verbose:
+            print(f"Extracting DNS records for: {domain}")
+        
+        subdomains_to_check, full_domains_to_check = [], []
+        if include_subdomains:
+            # Get the complete list of subdomains and full domains to check
+            subdomains_to_check, full_domains_to_check = self.get_subdomain_list(custom_subdomain_file, domain, skip_rfc_subdomains)
+        
+        # Lookups stream through a bounded window of tasks; the semaphore
+        # keeps the number of in-flight queries bounded
+        sem = asyncio.Semaphore(self.max_workers)
+        subdomain_record_types = SUBDOMAIN_RECORD_TYPES
+        
+        # Build every fully-qualified name once; the lookup list only
+        # references these strings. A custom full domain can repeat a
+        # generated name, so drop duplicates (keeping order) before any
+        # query is scheduled. Custom entries are lower-cased, so the domain is too
+        subdomain_fqdns = [f"{s}.{domain.lower()}" for s in subdomains_to_check]
+        fqdns = list(dict.fromkeys(subdomain_fqdns + full_domains_to_check))
+        
+        # A random label only resolves if the zone has a wildcard; the probe
+        # runs alongside the main domain lookups
+        wildcard_probe = None
+        if include_subdomains and self.wildcard_check:
+            probe_name = f"{secrets.token_hex(8)}.{domain.lower()}"
+            wildcard_probe = asyncio.ensure_future(self._resolve_subdomain(probe_name, sem))
+        
+        main_record_types = self.common_record_types
+        main_results_by_type = {}
+        try:
+            if self.use_any:
+                main_results_by_type = await self._try_any(domain, main_record_types, sem)
+                if main_results_by_type:
+                    # Only important types missing from the ANY answer get a targeted query
+                    main_record_types = [rt for rt in main_record_types
+                                         if rt not in main_results_by_type and rt in DETAILED_RECORD_TYPES]
             
-            # Get short format
-            short_result = self.run_dig_command(domain, record_type)
+            # The main domain is a single round of queries; resolve it first so
+            # its section is complete before subdomain results start streaming
+            main_lookups = [(domain, rt) for rt in main_record_types]
+            async for index, result in self._iter_resolved(main_lookups, sem):
+                main_results_by_type[main_record_types[index]] = result
+            wildcard_results = await wildcard_probe if wildcard_probe is not None else None
+        finally:
+            if wildcard_probe is not None:
+                wildcard_probe.cancel()
+        
+        # Records for main domain
+        if verbose:
+            print(f"\n--- Main domain: {domain} ---")
+        for record_type in self.common_record_types:
+            result = main_results_by_type.get(record_type)
+            values = self._result_values(result)
             
-            if short_result:
-                records['records'][record_type] = {
-                    'values': short_result.split('\n'),
-                    'count': len(short_result.split('\n'))
-                }
-                print(f" Found {len(short_result.split('\n'))} record(s)")
+            if values:
+                entry = RecordSet(values)
+                if verbose:
+                    print(f"  Checking {record_type} records... Found {len(values)} record(s)")
                 
-                # Get detailed format for important records
-                if record_type in ['SOA', 'NS', 'MX']:
-                    detailed = self.get_detailed_record(domain, record_type)
-                    if detailed:
-                        records['records'][record_type]['detailed'] = detailed
-            else:
-                print(" None found")
+                # Detailed format for important records, taken from the same response
+                if record_type in DETAILED_RECORD_TYPES:
+                    entry.detailed = self.format_detailed(result)
+                yield 'records', domain, record_type, entry
+            elif verbose:
+                print(f"  Checking {record_type} records... None found")
         
-        # Extract records for subdomains
+        # Records for subdomains
         if include_subdomains:
-            print(f"\n--- Checking subdomains ---")
+            if verbose:
+                print(f"\n--- Checking subdomains ---")
             subdomain_count = 0
+            names_checked = 0
+            # Progress lines are buffered and written at most once a second
+            progress = []
+            last_flush = time.monotonic()
             
-            # Get the complete list of subdomains and full domains to check
-            subdomains_to_check, full_domains_to_check = self.get_subdomain_list(custom_subdomain_file, domain, skip_rfc_subdomains)
-            
-            # Check regular subdomains
-            total_to_check = len(subdomains_to_check)
-            for i, subdomain in enumerate(subdomains_to_check, 1):
-                full_subdomain = f"{subdomain}.{domain}"
-                subdomain_records = {}
-                has_records = False
-                
-                # Only check A, AAAA, and CNAME for subdomains (most relevant)
-                for record_type in ['A', 'AAAA', 'CNAME']:
-                    short_result = self.run_dig_command(full_subdomain, record_type)
-                    
-                    if short_result:
-                        subdomain_records[record_type] = {
-                            'values': short_result.split('\n'),
-                            'count': len(short_result.split('\n'))
-                        }
-                        has_records = True
-                
-                if has_records:
-                    records['subdomains'][full_subdomain] = subdomain_records
+            # The wildcard's own records are reported under *.domain; names
+            # whose records are exactly the wildcard's are not reported
+            wildcard = None
+            if wildcard_results is not None:
+                wildcard = {}
+                wildcard_name = f"*.{domain.lower()}"
+                for record_type, result in zip(subdomain_record_types, wildcard_results):
+                    values = self._result_values(result)
+                    if values:
+                        wildcard[record_type] = frozenset(values)
+                        yield 'subdomains', wildcard_name, record_type, RecordSet(values)
+                if wildcard:
                     subdomain_count += 1
-                    print(f"  Found records for: {full_subdomain}")
-                
-                # Show progress every 10 subdomains
-                if i % 10 == 0:
-                    print(f"  Progress: {i}/{total_to_check} subdomains checked...")
+                    if verbose:
+                        found = ', '.join(f"{rt} {' '.join(sorted(v))}" for rt, v in wildcard.items())
+                        print(f"  Wildcard DNS detected ({wildcard_name} -> {found}); matching subdomains are skipped")
             
-            # Check full domains from custom list
-            for full_domain in full_domains_to_check:
-                subdomain_records = {}
-                has_records = False
+            # Each name takes one window slot: its probe runs first and the
+            # types it left open are queried as soon as it settles
+            jobs = ((name_index, self._resolve_subdomain(fqdn, sem)) for name_index, fqdn in enumerate(fqdns))
+            async for name_index, results in self._iter_completed(jobs):
+                if isinstance(results, BaseException):
+                    raise results
+                fqdn = fqdns[name_index]
+                entries = []
+                for record_type, result in zip(subdomain_record_types, results):
+                    values = self._result_values(result)
+                    if values:
+                        entries.append(('subdomains', fqdn, record_type, RecordSet(values)))
                 
-                # Check A, AAAA, and CNAME for full domains
-                for record_type in ['A', 'AAAA', 'CNAME']:
-                    short_result = self.run_dig_command(full_domain, record_type)
-                    
-                    if short_result:
-                        subdomain_records[record_type] = {
-                            'values': short_result.split('\n'),
-                            'count': len(short_result.split('\n'))
-                        }
-                        has_records = True
+                if wildcard and {e[2]: frozenset(e[3].values) for e in entries} == wildcard:
+                    entries = []
                 
-                if has_records:
-                    records['subdomains'][full_domain] = subdomain_records
+                if entries:
                     subdomain_count += 1
-                    print(f"  Found records for: {full_domain}")
+                    if verbose:
+                        progress.append(f"  Found records for: {fqdn}\n")
+                    for entry in entries:
+                        yield entry
+                
+                names_checked += 1
+                if verbose:
+                    # Show progress every 10 subdomains
+                    if names_checked % 10 == 0:
+                        progress.append(f"  Progress: {names_checked}/{len(fqdns)} subdomains checked...\n")
+                    now = time.monotonic()
+                    if progress and now - last_flush >= 1:
+                        sys.stdout.write(''.join(progress))
+                        progress.clear()
+                        last_flush = now
             
-            print(f"  Total domains/subdomains with records: {subdomain_count}")
-        
-        return records
+            if verbose:
+                sys.stdout.write(''.join(progress))
+                print(f"  Total domains/subdomains with records: {subdomain_count}")
 
     def output_text(self, data: Dict):
         """Output in human-readable text format"""
@@ -296,14 +1261,14 @@ class DNSDumper:
         # Main domain records
         print(f"\nMAIN DOMAIN RECORDS:")
         for record_type, info in data['records'].items():
-            print(f"\n{record_type} Records ({info['count']} found):")
+            print(f"\n{record_type} Records ({info.count} found):")
             print("-" * 40)
-            for value in info['values']:
+            for value in info.values:
                 print(f"  {value}")
             
-            if 'detailed' in info:
+            if info.detailed is not None:
                 print(f"\nDetailed {record_type} Information:")
-                print(info['detailed'])
+                print(info.detailed)
         
         # Subdomain records
         if 'subdomains' in data and data['subdomains']:
@@ -315,36 +1280,34 @@ class DNSDumper:
                 print(f"\n{subdomain}:")
                 print("-" * len(subdomain))
                 for record_type, info in records.items():
-                    print(f"  {record_type}: {', '.join(info['values'])}")
+                    print(f"  {record_type}: {', '.join(info.values)}")
         else:
             print(f"\nNo subdomain records found.")
 
+    def _iter_data(self, data: Dict) -> Iterator[Tuple[str, str, str, RecordSet]]:
+        """Yield (scope, name, record_type, entry) tuples from an extracted dict"""
+        for record_type, info in data['records'].items():
+            yield 'records', data['domain'], record_type, info
+        for subdomain, records in data.get('subdomains', {}).items():
+            for record_type, info in records.items():
+                yield 'subdomains', subdomain, record_type, info
+
+    def _write_data(self, writer, data: Dict):
+        """Feed an already extracted dict through a stream writer"""
+        writer.begin(data['domain'], data['timestamp'])
+        try:
+            for item in self._iter_data(data):
+                writer.write(*item)
+        finally:
+            writer.end()
+
     def output_csv(self, data: Dict, filename: str):
         """Output in CSV format"""
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['Domain', 'Subdomain', 'Record Type', 'Value', 'Timestamp'])
-            
-            # Main domain records
-            for record_type, info in data['records'].items():
-                for value in info['values']:
-                    writer.writerow([data['domain'], '', record_type, value, data['timestamp']])
-            
-            # Subdomain records
-            if 'subdomains' in data:
-                for subdomain, records in data['subdomains'].items():
-                    for record_type, info in records.items():
-                        for value in info['values']:
-                            writer.writerow([data['domain'], subdomain, record_type, value, data['timestamp']])
-        
-        print(f"CSV output saved to: {filename}")
+        self._write_data(CSVRecordWriter(filename), data)
 
     def output_json(self, data: Dict, filename: str):
         """Output in JSON format"""
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=2, ensure_ascii=False)
-        
-        print(f"JSON output saved to: {filename}")
+        self._write_data(JSONRecordWriter(filename), data)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -353,6 +1316,7 @@ def main():
     parser.add_argument('domain', help='Domain to analyze')
     parser.add_argument('--csv', help='Save results to CSV file')
     parser.add_argument('--json', help='Save results to JSON file')
+    parser.add_argument('--jsonl', help='Stream results to a JSON Lines file, one record set per line')
     parser.add_argument('--quiet', '-q', action='store_true', 
                        help='Suppress progress output')
     parser.add_argument('--no-subdomains', action='store_true',
@@ -361,47 +1325,82 @@ def main():
                        help='Load additional subdomains from file (one per line)')
     parser.add_argument('--skip-rfc-subdomains', action='store_true',
                        help='Skip RFC-defined underscore subdomains (faster scanning)')
+    parser.add_argument('--workers', type=int, default=64, metavar='N',
+                       help='Maximum number of concurrent DNS queries (default: 64)')
+    parser.add_argument('--replicate', type=int, default=1, metavar='N',
+                       help='Race A/AAAA/CNAME queries across N nameservers (default: 1)')
+    parser.add_argument('--nameservers', '--resolvers', metavar='LIST', default=','.join(PUBLIC_RESOLVERS),
+                       help='Comma-separated nameservers to spread queries across, as ADDRESS or ADDRESS#PORT '
+                            f'(default: {",".join(PUBLIC_RESOLVERS)})')
+    parser.add_argument('--query-timeout', type=float, default=0.5, metavar='SECONDS',
+                       help='Timeout of the first query attempt; each of the two retries doubles it (default: 0.5)')
+    parser.add_argument('--any', action='store_true',
+                       help='Try a single ANY query for the main domain and each subdomain first; many resolvers '
+                            'refuse or answer it partially (RFC 8482)')
+    parser.add_argument('--skip-wildcard-check', action='store_true',
+                       help='Report subdomains even if they only match a wildcard DNS record')
+    parser.add_argument('--cache-file', metavar='FILE',
+                       help='Keep answers in this SQLite file between runs and reuse them until their TTL expires')
     
     args = parser.parse_args()
     
-    # Check if dig is available
-    try:
-        subprocess.run(['dig', '-v'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Error: 'dig' command not found. Please install bind-utils or dnsutils package.")
-        sys.exit(1)
+    nameservers = [ns.strip() for ns in args.nameservers.split(',') if ns.strip()]
+    if not nameservers:
+        parser.error('--nameservers needs at least one nameserver')
+    for nameserver in nameservers:
+        address, _, port = nameserver.partition('#')
+        try:
+            # Replies are matched by address, which carries no scope on the wire
+            if getattr(ipaddress.ip_address(address), 'scope_id', None):
+                raise ValueError(address)
+            if port and not 0 < int(port) <= 65535:
+                raise ValueError(port)
+        except ValueError:
+            parser.error(f"invalid nameserver '{nameserver}' (expected an IP address without a %scope, optionally followed by #PORT "
+                         f"with PORT between 1 and 65535)")
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.query_timeout <= 0:
+        parser.error('--query-timeout must be positive')
+    if not 1 <= args.replicate <= len(nameservers):
+        parser.error(f'--replicate must be between 1 and {len(nameservers)}')
     
-    dumper = DNSDumper()
+    dumper = DNSDumper(timeout=args.query_timeout, max_workers=args.workers,
+                       replicate=args.replicate, nameservers=nameservers, use_any=args.any,
+                       verbose=not args.quiet, cache_file=args.cache_file,
+                       wildcard_check=not args.skip_wildcard_check)
+    
+    # File outputs are written while the records are being extracted
+    writers = []
+    if args.csv:
+        writers.append(CSVRecordWriter(args.csv))
+    if args.json:
+        writers.append(JSONRecordWriter(args.json))
+    if args.jsonl:
+        writers.append(JSONLRecordWriter(args.jsonl))
     
     # Extract DNS records
     dns_data = dumper.extract_dns_records(
         args.domain, 
         include_subdomains=not args.no_subdomains,
         custom_subdomain_file=args.subdomain_list,
-        skip_rfc_subdomains=args.skip_rfc_subdomains
+        skip_rfc_subdomains=args.skip_rfc_subdomains,
+        writers=writers
     )
     
     # Output results
     if not args.quiet:
         dumper.output_text(dns_data)
     
-    if args.csv:
-        dumper.output_csv(dns_data, args.csv)
-    
-    if args.json:
-        dumper.output_json(dns_data, args.json)
-    
     # Summary
-    total_main_records = sum(info['count'] for info in dns_data['records'].values())
-    total_subdomain_records = 0
-    if 'subdomains' in dns_data:
-        for subdomain_records in dns_data['subdomains'].values():
-            total_subdomain_records += sum(info['count'] for info in subdomain_records.values())
+    stats = dns_data['_stats']
+    total_main_records = stats['main_records']
+    total_subdomain_records = stats['subdomain_records']
     
     print(f"\nSummary:")
     print(f"  Main domain: {total_main_records} DNS records across {len(dns_data['records'])} record types")
-    if 'subdomains' in dns_data and dns_data['subdomains']:
-        print(f"  Subdomains: {total_subdomain_records} records across {len(dns_data['subdomains'])} subdomains")
+    if stats['subdomains_hit']:
+        print(f"  Subdomains: {total_subdomain_records} records across {stats['subdomains_hit']} subdomains")
     print(f"  Total: {total_main_records + total_subdomain_records} DNS records")
 
 if __name__ == '__main__':
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Offline regression tests for dns_dumper (no network access needed)
+"""
+
+import asyncio
+import unittest
+
+import dns.message
+import dns.rcode
+import dns.resolver
+import dns.rrset
+
+from dns_dumper import DNSDumper
+
+
+def dangling_cname_response(name: str, target: str) -> dns.message.Message:
+    """Build the NXDOMAIN reply a resolver sends for A at a CNAME to a missing name"""
+    response = dns.message.make_response(dns.message.make_query(name, 'A'))
+    response.set_rcode(dns.rcode.NXDOMAIN)
+    response.answer.append(dns.rrset.from_text(name, 300, 'IN', 'CNAME', target))
+    # Round-trip through wire format like a real reply
+    return dns.message.from_wire(response.to_wire())
+
+
+class DanglingCNAMETest(unittest.TestCase):
+    name = 'dangling.example.com'
+    target = 'nowhere.example.com.'
+
+    def setUp(self):
+        self.dumper = DNSDumper(nameservers=['127.0.0.1'], verbose=False)
+        self.response = dangling_cname_response(self.name + '.', self.target)
+
+    def test_answer_from_rrset_of_nxdomain_reply(self):
+        rrset = self.response.answer[0]
+        answer = DNSDumper._answer_from_rrset(rrset, self.response)
+        self.assertEqual(self.dumper._result_values(answer), [self.target])
+
+    def test_probe_keeps_dangling_cname(self):
+        qname = self.response.question[0].name
+        error = dns.resolver.NXDOMAIN(qnames=[qname], responses={qname: self.response})
+
+        async def aresolve(name, record_type, sem):
+            raise error
+        self.dumper._aresolve = aresolve
+
+        outcome = asyncio.run(self.dumper._probe_subdomain(self.name, None))
+        self.assertIs(outcome, error)
+        cname = self.dumper.cache.get((self.name, 'CNAME'))
+        self.assertEqual(self.dumper._result_values(cname), [self.target])
+        # The name exists, so AAAA must still be looked up
+        self.assertIsNone(self.dumper.cache.get((self.name, 'AAAA')))
+
+
+if __name__ == '__main__':
+    unittest.main()